@@ -3,9 +3,29 @@
 ########################
 
 import pandas as pd
-import pathlib 
+import os
+import re
+import warnings
 import numpy as np
-from scipy.stats import entropy
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from scipy.stats import skew
+
+# PyArrow is optional, checks fall back to pandas/NumPy without it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+
+# Numba is optional, the structure tokenizer falls back to NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 ########################
 #Data Read in function 
@@ -15,18 +35,69 @@ from scipy.stats import entropy
 def read_df(input):
     if isinstance(input, pd.DataFrame):
         return input
-    
-    try:
-        path = pathlib.Path(input)
 
-    except TypeError:
+    if not isinstance(input, (str, bytes, os.PathLike)):
         raise TypeError("Input must be a DataFrame or a path to a CSV file")
 
-    if path.is_file() and path.suffix == ".csv":
+    # Plain string check, a missing file is reported by read_csv itself
+    path = os.fsdecode(input)
+
+    if not path.lower().endswith(".csv"):
+        print("Error. Try pass a CSV direct or Filepath to a CSV.")
+        return None
+
+    if pa is None:
         return pd.read_csv(path)
 
-    print("Error. Try pass a CSV direct or Filepath to a CSV.")
-    return None
+    # Arrow-backed columns keep strings and nulls in contiguous buffers
+    return pd.read_csv(path, dtype_backend="pyarrow")
+
+
+def _arrow_column(series):
+    """
+    Convert a pandas column to Arrow, stringifying mixed-type object columns.
+    """
+    try:
+        return pa.array(series, from_pandas=True)
+    except (pa.ArrowException, OverflowError):
+        # Mixed objects have no single Arrow type, keep nulls as nulls
+        return pa.array(series.astype(str).where(series.notna(), None), type=pa.string())
+
+
+def read_arrow(input):
+    """
+    Read a CSV straight into a PyArrow Table, skipping pandas.
+
+    A pandas DataFrame is converted to a Table instead.
+    """
+    if pa is None:
+        raise ImportError("read_arrow requires pyarrow")
+
+    if isinstance(input, pa.Table):
+        return input
+
+    if isinstance(input, pd.DataFrame):
+        return pa.Table.from_arrays(
+            [_arrow_column(series) for _, series in input.items()],
+            names=[str(col) for col in input.columns],
+        )
+
+    if not isinstance(input, (str, bytes, os.PathLike)):
+        raise TypeError("Input must be a DataFrame, Arrow Table or a path to a CSV file")
+
+    path = os.fsdecode(input)
+
+    if not path.lower().endswith(".csv"):
+        print("Error. Try pass a CSV direct or Filepath to a CSV.")
+        return None
+
+    return pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=64 << 20),
+        # Free-text columns may contain quoted newlines
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
 
 
 
@@ -34,6 +105,167 @@ def read_df(input):
 #Main function to call
 ########################
 
+# Character classes used by the structure tokenizer
+_ALPHA, _DIGIT, _SPACE, _NEWLINE, _TAB, _RETURN, _OTHER = range(7)
+
+# Lookup table mapping every Latin-1 code point to its character class
+_CHAR_CLASS_LUT = np.full(256, _OTHER, dtype=np.uint8)
+for _cp in range(256):
+    if chr(_cp).isalpha():
+        _CHAR_CLASS_LUT[_cp] = _ALPHA
+    elif chr(_cp).isdigit():
+        _CHAR_CLASS_LUT[_cp] = _DIGIT
+_CHAR_CLASS_LUT[ord(" ")] = _SPACE
+_CHAR_CLASS_LUT[ord("\n")] = _NEWLINE
+_CHAR_CLASS_LUT[ord("\t")] = _TAB
+_CHAR_CLASS_LUT[ord("\r")] = _RETURN
+
+# Token formatters per class (OTHER is formatted from the character itself)
+_TOKEN_FORMAT = {
+    _ALPHA: "ALPHA({})".format,
+    _DIGIT: "DIGIT({})".format,
+    _SPACE: lambda n: "SPACE",
+    _NEWLINE: lambda n: "NEWLINE",
+    _TAB: lambda n: "TAB",
+    _RETURN: lambda n: "RETURN",
+}
+
+# Plain list copy of the lookup table for the pure Python path
+_CHAR_CLASS_LIST = _CHAR_CLASS_LUT.tolist()
+
+# Maximum number of tokens kept per pattern
+_MAX_TOKENS = 20
+
+# Below this length a plain Python loop beats the NumPy/Numba setup cost
+_SHORT_STRING_LEN = 48
+
+
+def _rle_python(val_str):
+    """
+    Classify and run-length encode a short string character by character.
+
+    Returns (class_id, run_length) pairs for at most _MAX_TOKENS tokens.
+    """
+    runs = []
+    prev = -1
+
+    for char in val_str:
+        cp = ord(char)
+        if cp < 256:
+            cls = _CHAR_CLASS_LIST[cp]
+        else:
+            cls = _ALPHA if char.isalpha() else _DIGIT if char.isdigit() else _OTHER
+
+        # Only letter and digit runs are merged
+        if cls == prev and cls <= _DIGIT:
+            runs[-1][1] += 1
+        elif len(runs) == _MAX_TOKENS:
+            break
+        else:
+            runs.append([cls, 1])
+            prev = cls
+
+    return runs
+
+
+def _rle_numpy(val_str, code_points):
+    """
+    Classify characters with the lookup table and run-length encode them with NumPy.
+
+    Returns (class_id, run_length) pairs for at most _MAX_TOKENS tokens.
+    """
+    wide = code_points > 255
+
+    classes = _CHAR_CLASS_LUT[np.where(wide, 0, code_points)]
+
+    # Characters outside Latin-1 fall back to the str predicates
+    for i in np.flatnonzero(wide):
+        char = val_str[i]
+        classes[i] = _ALPHA if char.isalpha() else _DIGIT if char.isdigit() else _OTHER
+
+    # Only letter and digit runs are merged, every other character is its own token
+    mergeable = classes[1:] <= _DIGIT
+    starts = np.flatnonzero(np.r_[True, (classes[1:] != classes[:-1]) | ~mergeable])
+    lengths = np.diff(np.r_[starts, classes.size])
+
+    return list(zip(classes[starts[:_MAX_TOKENS]].tolist(), lengths[:_MAX_TOKENS].tolist()))
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _rle_classify(code_points, lut, max_tokens):
+        """
+        Classify Latin-1 code points and run-length encode them in a single native loop.
+
+        Stops as soon as max_tokens tokens have been produced.
+        """
+        out = np.empty((min(code_points.size, max_tokens), 2), np.int32)
+        n_tokens = 0
+        i = 0
+
+        while i < code_points.size and n_tokens < max_tokens:
+            cls = lut[code_points[i]]
+            j = i + 1
+
+            # Only letter and digit runs are merged
+            if cls <= 1:
+                while j < code_points.size and lut[code_points[j]] == cls:
+                    j += 1
+
+            out[n_tokens, 0] = cls
+            out[n_tokens, 1] = j - i
+            n_tokens += 1
+            i = j
+
+        return out[:n_tokens]
+
+    # Compile at import so the first profiled value does not pay for it
+    _rle_classify(np.zeros(1, dtype=np.uint32), _CHAR_CLASS_LUT, _MAX_TOKENS)
+
+
+def _structure_from_string(val_str):
+    """
+    Run-length encode the character classes of a string into a structure pattern.
+    """
+    if len(val_str) < _SHORT_STRING_LEN:
+        runs = _rle_python(val_str)
+    else:
+        code_points = np.frombuffer(val_str.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+        # The native loop only knows Latin-1, wider characters take the NumPy path
+        if njit is not None and code_points.max() <= 255:
+            runs = _rle_classify(code_points, _CHAR_CLASS_LUT, _MAX_TOKENS).tolist()
+        else:
+            runs = _rle_numpy(val_str, code_points)
+
+    structure = []
+    pos = 0
+    for cls, length in runs:
+        if cls == _OTHER:
+            structure.append(f"'{val_str[pos]}'")
+        else:
+            structure.append(_TOKEN_FORMAT[cls](length))
+        pos += length
+
+    return '-'.join(structure)
+
+
+def get_structure_pattern_series(s: pd.Series) -> pd.Series:
+    """
+    Extract structural characteristics for a whole column without exposing content.
+
+    Missing values map to None, matching get_structure_pattern.
+    """
+    mask = s.notna().to_numpy(dtype=bool)
+    values = s[mask].astype(str).values
+
+    patterns = np.full(len(s), None, dtype=object)
+    patterns[mask] = [_structure_from_string(v) for v in values]
+
+    return pd.Series(patterns, index=s.index, name=s.name)
+
+
 # For the sake of transparency, this function was created by ChatGPT and was derived from the original df_checker function, 
 # but with significant enhancements to provide context around structural characteristics of the data while preserving privacy. 
 # The original function this was derived from is still available in the codebase for reference.
@@ -45,41 +277,375 @@ def get_structure_pattern(val):
     """
     if pd.isna(val):
         return None
-    
-    val_str = str(val)
-    
-    # Create a structure representation
-    structure = []
-    i = 0
-    while i < len(val_str):
-        char = val_str[i]
-        if char.isalpha():
-            # Count consecutive letters
-            count = 1
-            while i + count < len(val_str) and val_str[i + count].isalpha():
-                count += 1
-            structure.append(f"ALPHA({count})")
-            i += count
-        elif char.isdigit():
-            # Count consecutive digits
-            count = 1
-            while i + count < len(val_str) and val_str[i + count].isdigit():
-                count += 1
-            structure.append(f"DIGIT({count})")
-            i += count
-        elif char in ['\n', '\t', '\r']:
-            structure.append(f"NEWLINE" if char == '\n' else "TAB" if char == '\t' else "RETURN")
-            i += 1
-        elif char == ' ':
-            structure.append("SPACE")
-            i += 1
-        else:
-            structure.append(f"'{char}'")
-            i += 1
-    
-    return '-'.join(structure[:20])  # Limit length
+
+    return _structure_from_string(str(val))
+
+
+
+# Strings that look like plain integers or decimals
+_NUMERIC_LIKE_PATTERN = r'^-?\d+(\.\d+)?$'
+
+# RE2 form of the same pattern for PyArrow (Unicode digits, optional trailing newline like Python's "$")
+_NUMERIC_LIKE_PATTERN_RE2 = r'^-?\p{Nd}+(\.\p{Nd}+)?\n?$'
+
+
+def _numeric_like_ratio(values):
+    """
+    Share of non-null values that look like plain numbers.
+    """
+    if pa is None:
+        return values.dropna().astype(str).str.match(_NUMERIC_LIKE_PATTERN).mean()
+
+    try:
+        # Zero-copy for Arrow-backed columns, NaN/None become nulls
+        arr = pa.array(values, from_pandas=True)
+    except (pa.ArrowException, OverflowError):
+        # e.g. mixed objects or ints beyond int64
+        arr = None
+
+    if arr is None or not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        # Mixed or non-string objects, stringify first
+        arr = pa.array(values.dropna().astype(str).to_numpy(), type=pa.string())
+
+    return _numeric_like_ratio_arrow(pc.drop_null(arr))
+
+
+def _numeric_like_ratio_arrow(arr):
+    """
+    Share of values in a null-free Arrow string array that look like plain numbers.
+    """
+    mask = pc.match_substring_regex(arr, _NUMERIC_LIKE_PATTERN_RE2)
+    return pc.sum(mask).as_py() / len(arr)
+
+
+# Entropy is only scored below this many unique values
+_ENTROPY_MAX_UNIQUE = 10000
+
+# Unique ratio above which a column is treated as near-distinct
+_HIGH_CARDINALITY_RATIO = 0.95
+
+# Share of leading rows sampled to rule out near-distinct columns cheaply
+_CARDINALITY_SAMPLE_FRACTION = 0.1
+
+
+def _is_near_distinct(n_unique, total_rows):
+    """
+    Whether a column with (at most) n_unique values is near-distinct past the entropy limit.
+
+    Also used with upper bounds on the unique count: False then rules the column out exactly.
+    """
+    return n_unique / total_rows > _HIGH_CARDINALITY_RATIO and n_unique >= _ENTROPY_MAX_UNIQUE
+
+
+def _numpy_equivalent_dtype(dtype, has_nulls):
+    """
+    NumPy dtype the default (non-Arrow) pandas backend would give this column.
+    """
+    if not isinstance(dtype, pd.ArrowDtype):
+        return dtype
+
+    pa_type = dtype.pyarrow_dtype
+
+    if pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type):
+        return np.dtype(object)
+
+    # Entirely empty CSV columns read as float64 (all NaN)
+    if pa.types.is_null(pa_type):
+        return np.dtype(np.float64)
+
+    # Missing values force integers to float64 and booleans to object
+    if has_nulls and pa.types.is_integer(pa_type):
+        return np.dtype(np.float64)
+    if has_nulls and pa.types.is_boolean(pa_type):
+        return np.dtype(object)
+
+    return dtype.numpy_dtype
+
+
+# Numeric dtypes whose values are all exactly representable as float32
+_FLOAT32_EXACT_DTYPES = {
+    np.dtype(t) for t in (np.float16, np.float32, np.int8, np.int16, np.uint8, np.uint16)
+}
+
+
+def _stats_dtype(dtypes):
+    """
+    Narrowest float dtype that holds every value of the given numeric columns exactly.
+    """
+    numpy_dtypes = [getattr(dtype, "numpy_dtype", dtype) for dtype in dtypes]
+    if all(dtype in _FLOAT32_EXACT_DTYPES for dtype in numpy_dtypes):
+        return np.float32
+    return np.float64
+
+
+def _entropy_bits(counts_arr):
+    """
+    Shannon entropy (base 2) of a frequency distribution given as raw counts.
+    """
+    n = counts_arr.sum()
+    return float(np.log2(n) - np.dot(counts_arr, np.log2(counts_arr)) / n)
+
+
+def _pandas_count_distinct(series):
+    """
+    Number of distinct non-null values in a pandas Series.
+    """
+    return series.nunique(dropna=True)
+
+
+def _pandas_head_counts(series, n):
+    """
+    (non-null count, distinct count) of the first n values of a pandas Series.
+    """
+    head = series.iloc[:n]
+    return int(head.count()), _pandas_count_distinct(head)
+
+
+def _arrow_count_distinct(column):
+    """
+    Number of distinct non-null values in an Arrow array.
+    """
+    return pc.count_distinct(column, mode="only_valid").as_py()
+
+
+def _arrow_head_counts(column, n):
+    """
+    (non-null count, distinct count) of the first n values of an Arrow array.
+    """
+    head = column.slice(0, n)
+    return len(head) - head.null_count, _arrow_count_distinct(head)
+
+
+def _probe_high_cardinality(values, n_non_null, total_rows, head_counts, count_distinct):
+    """
+    Whether a column is near-distinct past the entropy limit, and its unique count if so.
+
+    Each duplicate in a head sample lowers the bound nunique <= n_non_null, so only
+    columns that survive the bound pay for the full unique count.
+    Returns (high_cardinality, nunique), nunique being None for other columns.
+    """
+    if _is_near_distinct(n_non_null, total_rows):
+        n_valid, n_distinct = head_counts(values, int(total_rows * _CARDINALITY_SAMPLE_FRACTION))
+
+        if _is_near_distinct(n_non_null - (n_valid - n_distinct), total_rows):
+            nunique = count_distinct(values)
+
+            if _is_near_distinct(nunique, total_rows):
+                return True, nunique
+
+    return False, None
+
+
+def _uniqueness_profile(nunique, counts, n_non_null, total_rows, high_cardinality):
+    """
+    Uniqueness, entropy and dominant value part of a column profile.
+
+    counts is the frequency table of the non-null values (unused for high-cardinality columns).
+    Returns (profile, likely_identifier); the flag closes the profile after type-specific metrics.
+    """
+
+    # Ratio of unique values to total rows
+    unique_ratio = nunique / total_rows
+
+    # ----------------------------------
+    # ENTROPY (ID / randomness detection)
+    # ----------------------------------
+
+    entropy_score = None
+    if 1 < nunique < _ENTROPY_MAX_UNIQUE:
+        # Shannon entropy straight from the frequency counts
+        entropy_score = _entropy_bits(counts)
+
+    # ----------------------------------
+    # DOMINANT VALUE (variance signal)
+    # ----------------------------------
+
+    dominant_pct = None
+    near_zero_variance = False
+
+    if high_cardinality:
+        # Estimate assuming every value is distinct: a lower bound on the true
+        # share, and a column this unique can never be near-zero variance
+        dominant_pct = 100.0 / nunique
+    elif nunique > 0:
+        dominant_pct = float(counts.max() / n_non_null * 100)
+        near_zero_variance = dominant_pct > 95
+
+    profile = {
+        "unique_count": int(nunique),
+        "unique_ratio": round(unique_ratio, 3),
+        "entropy": round(entropy_score, 2) if entropy_score else None,
+        "dominant_value_pct": round(dominant_pct, 1) if dominant_pct else None,
+        "near_zero_variance": near_zero_variance,
+    }
+
+    # ----------------------------------
+    # IDENTIFIER LIKELIHOOD FLAG
+    # ----------------------------------
+
+    likely_identifier = (
+        unique_ratio > 0.95 and
+        entropy_score is not None and
+        entropy_score > 4
+    )
+
+    return profile, likely_identifier
+
 
 
+# Semantic keyword matchers for column names, one alternation per category
+_SEMANTIC_KEYWORD_RES = {
+    "likely_id_column": re.compile(r"id|uuid|key|ref"),
+    "likely_datetime_column": re.compile(r"date|time|timestamp"),
+    "likely_amount_column": re.compile(r"amount|price|cost|revenue|salary"),
+    "likely_count_column": re.compile(r"count|num|qty|quantity"),
+    "likely_ratio_column": re.compile(r"rate|pct|percent|ratio"),
+}
+
+
+# Column name token separators
+_TOK_RE = re.compile(r"[-_ ]+")
+
+
+def _column_name_profiles(columns):
+    """
+    Structural and semantic profile of each column name (names only, no data).
+    """
+
+    # All column names analysed together with vectorised string ops
+    names = pd.Index(columns, tupleize_cols=False).astype(str)
+
+    # np.select cannot build the case patterns from empty conditions
+    if len(names) == 0:
+        return {}
+
+    # Basic structural properties
+    lengths = names.str.len()
+    # str.isdigit, not \d: it also counts superscripts and other digit forms like '²'
+    contains_digit = names.map(lambda name: any(c.isdigit() for c in name))
+    contains_special = names.str.contains(r'[^\w]', regex=True)
+
+    # Tokenisation by underscore and basic camelCase splitting
+    token_counts = names.str.split(_TOK_RE).map(lambda tokens: sum(1 for t in tokens if t))
+
+    # Case pattern detection (first matching rule wins)
+    rest = names.str[1:]
+    case_types = np.select(
+        [
+            names.str.isupper(),
+            names.str.islower(),
+            names.str.contains("_", regex=False),
+            names.str[:1].str.isupper(),
+            rest.map(lambda tail: any(c.isupper() for c in tail)),
+        ],
+        ["UPPERCASE", "lowercase", "snake_case", "PascalCase", "camelCase"],
+        default="mixed",
+    )
+
+    # Semantic keyword detection (non-sensitive heuristics)
+    lowered = names.str.lower()
+
+    semantic_flags = {
+        flag: lowered.str.contains(pattern)
+        for flag, pattern in _SEMANTIC_KEYWORD_RES.items()
+    }
+
+    # Plain Python values so the profile prints cleanly
+    lengths = np.asarray(lengths).tolist()
+    token_counts = np.asarray(token_counts).tolist()
+    contains_digit = np.asarray(contains_digit).tolist()
+    contains_special = np.asarray(contains_special).tolist()
+    case_types = case_types.tolist()
+    semantic_flags = {flag: np.asarray(values).tolist() for flag, values in semantic_flags.items()}
+
+    column_name_profiles = {}
+
+    for i, name in enumerate(names):
+        column_name_profiles[name] = {
+            "length": lengths[i],
+            "token_count": token_counts[i],
+            "contains_digit": contains_digit[i],
+            "contains_special_char": contains_special[i],
+            "case_pattern": case_types[i],
+            **{flag: values[i] for flag, values in semantic_flags.items()}
+        }
+
+    return column_name_profiles
+
+
+
+def _profile_column(col, series, n_non_null, is_num, is_cat, num_stats_row, outlier_pct):
+    """
+    Structural profile of a single (non-empty) column for df_checker_v2.
+
+    Numeric stats and the outlier percentage are precomputed frame-wide and passed in.
+    Returns (col, profile).
+    """
+
+    total_rows = len(series)
+
+    # ----------------------------------
+    # UNIQUENESS ANALYSIS
+    # ----------------------------------
+
+    # Near-distinct columns past the entropy limit only need the unique count
+    high_cardinality, nunique = _probe_high_cardinality(
+        series, n_non_null, total_rows, _pandas_head_counts, _pandas_count_distinct
+    )
+
+    counts = None
+    if not high_cardinality:
+        # Frequency table, computed once and reused for all value-based metrics
+        counts = series.value_counts(dropna=True, sort=True).to_numpy(dtype=np.int64)
+        nunique = counts.size
+
+    profile, likely_identifier = _uniqueness_profile(
+        nunique, counts, n_non_null, total_rows, high_cardinality
+    )
+
+    # ----------------------------------
+    # NUMERIC COLUMN ANALYSIS
+    # ----------------------------------
+
+    if is_num and n_non_null > 0:
+
+        # Basic descriptive statistics and skewness, precomputed frame-wide
+        mean, std, min_val, max_val, skewness = num_stats_row
+
+        # IQR-based outlier percentage, only reported for more than 20 values
+        if n_non_null <= 20:
+            outlier_pct = None
+
+        profile.update({
+            "mean": round(mean, 2),
+            "std": round(std, 2),
+            "min": min_val,
+            "max": max_val,
+            "skewness": round(skewness, 2),
+            "highly_skewed": abs(skewness) > 2,
+            "outlier_pct": round(outlier_pct, 2) if outlier_pct else None,
+        })
+
+    # ----------------------------------
+    # CATEGORICAL COLUMN ANALYSIS
+    # ----------------------------------
+
+    if is_cat and n_non_null > 0:
+
+        # Detect numeric-like strings
+        numeric_like_ratio = _numeric_like_ratio(series)
+
+        mixed_type = 0.2 < numeric_like_ratio < 0.8
+
+        profile.update({
+            "numeric_like_ratio": round(float(numeric_like_ratio), 3),
+            "mixed_type_suspected": mixed_type,
+        })
+
+    profile["likely_identifier"] = likely_identifier
+
+    return col, profile
+
 
 # For the sake of transparency, this function was created by ChatGPT based on the original df_checker function, but with significant enhancements to provide
 # more structural insights while preserving privacy. The original function is still available in the codebase for reference, 
@@ -110,113 +676,244 @@ def df_checker_v2(data: pd.DataFrame) -> dict:
     # Extract column names (structure only, no data)
     col_names = data.columns.tolist()
 
-    # Count data types present in dataset
-    dtype_counts = data.dtypes.value_counts().to_dict()
+    # Column dtypes, read once and reused for classification
+    dtypes = data.dtypes
 
     # Identify numeric columns using pandas dtype inference
-    numeric_cols = data.select_dtypes(include="number").columns.tolist()
+    numeric_cols = [
+        col for col, dtype in dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ]
 
-    # Identify object (categorical/string) columns
-    cat_cols = data.select_dtypes(include="object").columns.tolist()
+    # Identify object (categorical/string) columns, including Arrow-backed strings
+    cat_cols = [col for col, dtype in dtypes.items() if pd.api.types.is_string_dtype(dtype)]
 
     # ==============================
     # MISSING VALUE ANALYSIS
     # ==============================
 
+    # Count missing values per column
+    if pa is not None and all(isinstance(dtype, pd.ArrowDtype) for dtype in dtypes):
+        # Arrow arrays track their null count, no mask needs to be built
+        null_counts = [pa.array(series).null_count for _, series in data.items()]
+    else:
+        null_counts = data.isna().to_numpy().sum(axis=0)
+
     # Compute percentage of missing values per column
-    per_null = data.isna().mean() * 100
+    per_null = pd.Series(null_counts, index=data.columns, dtype=np.float64) / len(data) * 100
+
+    # Count data types present in dataset, under the NumPy dtypes the default
+    # backend would infer so Arrow-backed frames report the same summary
+    dtype_counts = pd.Series(
+        [_numpy_equivalent_dtype(dtype, n > 0) for dtype, n in zip(dtypes, null_counts)],
+        dtype=object,
+    ).value_counts().to_dict()
+
+    # Non-null counts, reused by the column summaries instead of dropping NAs per column
+    non_null_counts = dict(zip(data.columns, (shape[0] - np.asarray(null_counts, dtype=np.int64)).tolist()))
 
     # Extract only columns with >10% missing
     cols_high_missing = per_null[per_null > 10].round(2).to_dict()
 
+    # ==============================
+    # NUMERIC SUMMARIES (frame-level)
+    # ==============================
+
+    num_stats = {}
+    outlier_pct_map = {}
+
+    if numeric_cols and shape[0] > 0:
+        numeric_data = data[numeric_cols]
+
+        # One numeric matrix shared by all aggregations, float32 when that is lossless
+        num_mat = numeric_data.to_numpy(dtype=_stats_dtype(dtypes[numeric_cols]), na_value=np.nan)
+        n_valid = np.asarray([non_null_counts[col] for col in numeric_cols])
+
+        # Descriptive statistics for all numeric columns, accumulated in float64
+        with warnings.catch_warnings():
+            # All-NaN columns are skipped below, ignore their empty-slice warnings
+            warnings.simplefilter("ignore", RuntimeWarning)
+
+            means = np.nanmean(num_mat, axis=0, dtype=np.float64)
+            stds = np.nanstd(num_mat, axis=0, ddof=1, dtype=np.float64)
+            mins = np.nanmin(num_mat, axis=0)
+            maxs = np.nanmax(num_mat, axis=0)
+            # Third moments lose precision in float32, so skew always runs on float64
+            skews = np.asarray(
+                skew(num_mat.astype(np.float64, copy=False), axis=0, bias=False, nan_policy="omit"),
+                dtype=np.float64,
+            )
+
+        # Match pandas: zero skew for constant columns, undefined below three values
+        skews = np.where(stds == 0, 0.0, skews)
+        skews = np.where(n_valid < 3, np.nan, skews)
+
+        num_stats = dict(zip(
+            numeric_cols,
+            np.column_stack([means, stds, mins, maxs, skews]).astype(np.float64).tolist(),
+        ))
+
+        # IQR-based outlier detection as a single pass over the numeric matrix
+        q = numeric_data.quantile([0.25, 0.75]).to_numpy(dtype=np.float64, na_value=np.nan)
+        iqr = q[1] - q[0]
+        lo = q[0] - 1.5 * iqr
+        hi = q[1] + 1.5 * iqr
+
+        mask = (num_mat < lo) | (num_mat > hi)
+        outlier_pct_map = dict(zip(numeric_cols, mask.sum(axis=0) / len(num_mat) * 100))
+
     # ==============================
     # COLUMN SUMMARIES
     # ==============================
 
     column_profiles = {}
 
-    for col in data.columns:
+    if shape[0] > 0:
 
-        series = data[col]
+        # Set lookups for the per-column type dispatch
+        numeric_set = set(numeric_cols)
+        cat_set = set(cat_cols)
 
-        # Drop NA values for structural analysis
-        non_null = series.dropna()
+        tasks = [
+            (
+                col, series, non_null_counts[col], col in numeric_set, col in cat_set,
+                num_stats.get(col), outlier_pct_map.get(col),
+            )
+            for col, series in data.items()
+        ]
 
-        total_rows = len(series)
+        # Columns are independent and the heavy work runs in GIL-releasing
+        # NumPy/pandas/PyArrow kernels, so threads share the frame without copies
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            column_profiles = dict(ex.map(lambda task: _profile_column(*task), tasks))
 
-        if total_rows == 0:
-            continue
+    # ==============================
+    # COLUMN NAME STRUCTURAL ANALYSIS
+    # ==============================
 
-        # ----------------------------------
-        # UNIQUENESS ANALYSIS
-        # ----------------------------------
+    column_name_profiles = _column_name_profiles(data.columns)
 
-        # Count unique values
-        nunique = series.nunique(dropna=True)
+    return {
+        "shape": shape,
+        "dtype_counts": dtype_counts,
+        "high_missing_columns_pct": cols_high_missing,
+        "column_profiles": column_profiles,
+        "column_name_profiles": column_name_profiles,
+        "privacy_note": "All metrics derived from structural and schema-level properties only."
+    }
 
-        # Ratio of unique values to total rows
-        unique_ratio = nunique / total_rows
 
-        # ----------------------------------
-        # ENTROPY (ID / randomness detection)
-        # ----------------------------------
 
-        entropy_score = None
-        if 1 < nunique < 10000:
-            # Normalized frequency distribution
-            probs = non_null.value_counts(normalize=True)
+########################
+#Arrow-native checker
+########################
 
-            # Shannon entropy
-            entropy_score = float(entropy(probs, base=2))
+def df_checker_arrow(data) -> dict:
+    """
+    Same structural analysis as df_checker_v2, computed with PyArrow kernels.
 
-        # ----------------------------------
-        # DOMINANT VALUE (variance signal)
-        # ----------------------------------
+    Accepts an Arrow Table, a pandas DataFrame or a path to a CSV (all via read_arrow).
+    Profiles are keyed by the DataFrame's original column labels; Arrow Tables and
+    CSVs only have string column names. Returns None if the input cannot be read.
+    All outputs avoid exposing actual content.
+    """
+    tbl = read_arrow(data)
 
-        dominant_pct = None
-        near_zero_variance = False
+    if tbl is None:
+        return None
+
+    # Report keys match df_checker_v2, Arrow itself stringifies column names
+    labels = list(data.columns) if isinstance(data, pd.DataFrame) else tbl.column_names
+
+    # ==============================
+    # BASIC DATASET METRICS
+    # ==============================
+
+    # A Table without columns has no rows, take the count from the frame itself
+    total_rows = len(data) if isinstance(data, pd.DataFrame) else tbl.num_rows
+    shape = (total_rows, tbl.num_columns)
+
+    # Count data types present in dataset
+    dtype_counts = dict(Counter(tbl.schema.types).most_common())
+
+    # ==============================
+    # MISSING VALUE ANALYSIS
+    # ==============================
 
-        if nunique > 0:
-            dominant_pct = float(non_null.value_counts(normalize=True).iloc[0] * 100)
-            near_zero_variance = dominant_pct > 95
+    # Null counts come from the Arrow array metadata
+    cols_high_missing = {}
+    if total_rows > 0:
+        for name, column in zip(labels, tbl.columns):
+            pct_missing = column.null_count / total_rows * 100
+            if pct_missing > 10:
+                cols_high_missing[name] = round(pct_missing, 2)
+
+    # ==============================
+    # COLUMN SUMMARIES
+    # ==============================
+
+    column_profiles = {}
+
+    for name, column in zip(labels, tbl.columns):
+
+        if total_rows == 0:
+            continue
+
+        col_type = column.type
+        n_non_null = total_rows - column.null_count
 
         # ----------------------------------
-        # TYPE-SPECIFIC ANALYSIS
+        # UNIQUENESS ANALYSIS
         # ----------------------------------
 
-        profile = {
-            "unique_count": int(nunique),
-            "unique_ratio": round(unique_ratio, 3),
-            "entropy": round(entropy_score, 2) if entropy_score else None,
-            "dominant_value_pct": round(dominant_pct, 1) if dominant_pct else None,
-            "near_zero_variance": near_zero_variance,
-        }
+        # Near-distinct columns past the entropy limit only need the unique count
+        high_cardinality, nunique = _probe_high_cardinality(
+            column, n_non_null, total_rows, _arrow_head_counts, _arrow_count_distinct
+        )
+
+        counts = None
+        if not high_cardinality:
+            # Frequency table (nulls dropped), reused for all value-based metrics
+            vc = pc.value_counts(column)
+            counts = pc.filter(vc.field("counts"), vc.field("values").is_valid()).to_numpy()
+            nunique = counts.size
+
+        profile, likely_identifier = _uniqueness_profile(
+            nunique, counts, n_non_null, total_rows, high_cardinality
+        )
 
         # ----------------------------------
         # NUMERIC COLUMN ANALYSIS
         # ----------------------------------
 
-        if col in numeric_cols and len(non_null) > 0:
+        if (pa.types.is_integer(col_type) or pa.types.is_floating(col_type)) and n_non_null > 0:
 
-            # Basic descriptive statistics
-            mean = float(non_null.mean())
-            std = float(non_null.std())
-            min_val = float(non_null.min())
-            max_val = float(non_null.max())
+            mean = pc.mean(column).as_py()
+            std = pc.stddev(column, ddof=1).as_py()
+            min_max = pc.min_max(column)
+            min_val = float(min_max["min"].as_py())
+            max_val = float(min_max["max"].as_py())
 
-            # Skewness detection
-            skewness = float(non_null.skew())
+            # Bias-corrected skewness, matching pandas (zero for constant columns)
+            if std == 0:
+                skewness = 0.0
+            else:
+                skewness = pc.skew(column, biased=False, min_count=3).as_py()
+
+            mean = float("nan") if mean is None else mean
+            std = float("nan") if std is None else std
+            skewness = float("nan") if skewness is None else skewness
 
             # IQR-based outlier detection
-            if len(non_null) > 20:
-                q1 = non_null.quantile(0.25)
-                q3 = non_null.quantile(0.75)
+            if n_non_null > 20:
+                q1, q3 = pc.quantile(column, q=[0.25, 0.75]).to_pylist()
                 iqr = q3 - q1
 
-                outliers = ((non_null < q1 - 1.5 * iqr) |
-                            (non_null > q3 + 1.5 * iqr)).sum()
-
-                outlier_pct = outliers / total_rows * 100
+                outside = pc.or_(
+                    pc.less(column, q1 - 1.5 * iqr),
+                    pc.greater(column, q3 + 1.5 * iqr),
+                )
+                outlier_pct = pc.sum(outside).as_py() / total_rows * 100
             else:
                 outlier_pct = None
 
@@ -234,15 +931,10 @@ def df_checker_v2(data: pd.DataFrame) -> dict:
         # CATEGORICAL COLUMN ANALYSIS
         # ----------------------------------
 
-        if col in cat_cols and len(non_null) > 0:
-
-            # Convert values to string
-            str_vals = non_null.astype(str)
+        if (pa.types.is_string(col_type) or pa.types.is_large_string(col_type)) and n_non_null > 0:
 
             # Detect numeric-like strings
-            numeric_like_ratio = str_vals.str.match(
-                r'^-?\d+(\.\d+)?$'
-            ).mean()
+            numeric_like_ratio = _numeric_like_ratio_arrow(pc.drop_null(column))
 
             mixed_type = 0.2 < numeric_like_ratio < 0.8
 
@@ -251,77 +943,16 @@ def df_checker_v2(data: pd.DataFrame) -> dict:
                 "mixed_type_suspected": mixed_type,
             })
 
-        # ----------------------------------
-        # IDENTIFIER LIKELIHOOD FLAG
-        # ----------------------------------
-
-        likely_identifier = (
-            unique_ratio > 0.95 and
-            entropy_score is not None and
-            entropy_score > 4
-        )
-
         profile["likely_identifier"] = likely_identifier
 
-        column_profiles[col] = profile
+        column_profiles[name] = profile
 
-        # ==============================
-        # COLUMN NAME STRUCTURAL ANALYSIS
-        # ==============================
-
-        column_name_profiles = {}
-
-        for col in data.columns:
-
-            name = str(col)
-
-            # Basic structural properties
-            length = len(name)
-            contains_digit = any(c.isdigit() for c in name)
-            contains_special = any(not c.isalnum() and c != "_" for c in name)
+    # ==============================
+    # COLUMN NAME STRUCTURAL ANALYSIS
+    # ==============================
 
-            # Tokenisation by underscore and basic camelCase splitting
-            tokens = (
-                name.replace("-", "_")
-                    .replace(" ", "_")
-                    .split("_")
-            )
+    column_name_profiles = _column_name_profiles(labels)
 
-            token_count = len([t for t in tokens if t])
-
-            # Case pattern detection
-            if name.isupper():
-                case_type = "UPPERCASE"
-            elif name.islower():
-                case_type = "lowercase"
-            elif "_" in name:
-                case_type = "snake_case"
-            elif name[:1].isupper() and not "_" in name:
-                case_type = "PascalCase"
-            elif any(c.isupper() for c in name[1:]):
-                case_type = "camelCase"
-            else:
-                case_type = "mixed"
-
-            # Semantic keyword detection (non-sensitive heuristics)
-            lowered = name.lower()
-
-            semantic_flags = {
-                "likely_id_column": any(k in lowered for k in ["id", "uuid", "key", "ref"]),
-                "likely_datetime_column": any(k in lowered for k in ["date", "time", "timestamp"]),
-                "likely_amount_column": any(k in lowered for k in ["amount", "price", "cost", "revenue", "salary"]),
-                "likely_count_column": any(k in lowered for k in ["count", "num", "qty", "quantity"]),
-                "likely_ratio_column": any(k in lowered for k in ["rate", "pct", "percent", "ratio"]),
-            }
-
-            column_name_profiles[name] = {
-                "length": length,
-                "token_count": token_count,
-                "contains_digit": contains_digit,
-                "contains_special_char": contains_special,
-                "case_pattern": case_type,
-                **semantic_flags
-            }
     return {
         "shape": shape,
         "dtype_counts": dtype_counts,
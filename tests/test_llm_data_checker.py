@@ -0,0 +1,94 @@
+import pytest
+
+from llm_data_checker import _column_name_profiles, get_structure_pattern
+
+
+def _original_column_name_profiles(columns):
+    """
+    Per-name loop the vectorised _column_name_profiles replaced, kept as the reference.
+    """
+    column_name_profiles = {}
+
+    for col in columns:
+
+        name = str(col)
+
+        # Basic structural properties
+        length = len(name)
+        contains_digit = any(c.isdigit() for c in name)
+        contains_special = any(not c.isalnum() and c != "_" for c in name)
+
+        # Tokenisation by underscore and basic camelCase splitting
+        tokens = (
+            name.replace("-", "_")
+                .replace(" ", "_")
+                .split("_")
+        )
+
+        token_count = len([t for t in tokens if t])
+
+        # Case pattern detection
+        if name.isupper():
+            case_type = "UPPERCASE"
+        elif name.islower():
+            case_type = "lowercase"
+        elif "_" in name:
+            case_type = "snake_case"
+        elif name[:1].isupper() and not "_" in name:
+            case_type = "PascalCase"
+        elif any(c.isupper() for c in name[1:]):
+            case_type = "camelCase"
+        else:
+            case_type = "mixed"
+
+        # Semantic keyword detection (non-sensitive heuristics)
+        lowered = name.lower()
+
+        semantic_flags = {
+            "likely_id_column": any(k in lowered for k in ["id", "uuid", "key", "ref"]),
+            "likely_datetime_column": any(k in lowered for k in ["date", "time", "timestamp"]),
+            "likely_amount_column": any(k in lowered for k in ["amount", "price", "cost", "revenue", "salary"]),
+            "likely_count_column": any(k in lowered for k in ["count", "num", "qty", "quantity"]),
+            "likely_ratio_column": any(k in lowered for k in ["rate", "pct", "percent", "ratio"]),
+        }
+
+        column_name_profiles[name] = {
+            "length": length,
+            "token_count": token_count,
+            "contains_digit": contains_digit,
+            "contains_special_char": contains_special,
+            "case_pattern": case_type,
+            **semantic_flags
+        }
+
+    return column_name_profiles
+
+
+@pytest.mark.parametrize("columns", [
+    # snake / camel / Pascal / upper / lower / mixed
+    ["user_id", "createdAt", "TotalRevenue", "ALLCAPS", "lower", "Mixed Case-x", "aB_c"],
+    # empty, whitespace and punctuation
+    ["", "  ", "a__b", "_ID", "x$y", "rate%", "--"],
+    # digits, including forms only str.isdigit accepts
+    ["9lives", "totalRevenue2", "area_m²", "a¹", "①x", "col٣"],
+    # titlecase letters are neither upper nor lower
+    ["aǅb", "ǅ", "fooǲ", "ǅ_x"],
+    # other non-ASCII letters
+    ["Ünïcode", "über", "éA", "ΩmegaPrice", "ß"],
+    # non-string labels are profiled by their str()
+    [3, 2.5, None, ("a", "b")],
+    # MultiIndex labels as a list of tuples
+    [("a", "x"), ("b", "y")],
+    # frame without columns
+    [],
+])
+def test_column_name_profiles_match_original(columns):
+    assert _column_name_profiles(columns) == _original_column_name_profiles(columns)
+
+
+def test_structure_pattern_long_string_with_lone_surrogates():
+    # read_csv(..., encoding_errors="surrogateescape") yields lone surrogates
+    assert get_structure_pattern("\ud800" * 60) == "-".join(["'\ud800'"] * 20)
+    assert get_structure_pattern("ab12\udc80" * 12) == "-".join(
+        ["ALPHA(2)-DIGIT(2)-'\udc80'"] * 6 + ["ALPHA(2)-DIGIT(2)"]
+    )